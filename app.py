@@ -1,7 +1,26 @@
 import streamlit as st
+from collections import defaultdict
 from datetime import datetime
 from main import MPINValidator
 
+_REASON_CATEGORY = {
+    'COMMON_PATTERN': 'Common Patterns',
+    'DEMOGRAPHIC_DOB_SELF': 'Demographic Matches',
+    'DEMOGRAPHIC_DOB_SPOUSE': 'Demographic Matches',
+    'DEMOGRAPHIC_ANNIVERSARY': 'Demographic Matches',
+    'DEMOGRAPHIC_COMBINED': 'Demographic Matches',
+    'INVALID_FORMAT': 'Format Issues',
+}
+_CATEGORY_ORDER = ('Common Patterns', 'Demographic Matches', 'Format Issues', 'Other')
+
+@st.cache_resource
+def get_validator():
+    return MPINValidator()
+
+@st.cache_data(max_entries=1024)
+def validate_cached(mpin, dob_str, spouse_dob_str, anniversary_str):
+    return get_validator().validate_mpin(mpin, dob_str, spouse_dob_str, anniversary_str)
+
 def format_date(date):
     return date.strftime('%d-%m-%Y')
 
@@ -11,18 +30,14 @@ def display_reasons(reasons):
     
     st.markdown("### Reasons for Weakness:")
     
-    categories = {
-        'Common Patterns': ['COMMON_PATTERN'],
-        'Demographic Matches': ['DEMOGRAPHIC_DOB_SELF', 'DEMOGRAPHIC_DOB_SPOUSE',
-                              'DEMOGRAPHIC_ANNIVERSARY', 'DEMOGRAPHIC_COMBINED'],
-        'Format Issues': ['INVALID_FORMAT']
-    }
+    grouped = defaultdict(list)
+    for reason_type, explanations in reasons.items():
+        grouped[_REASON_CATEGORY.get(reason_type, 'Other')].append((reason_type, explanations))
     
-    for category, reason_types in categories.items():
-        category_reasons = {k: v for k, v in reasons.items() if k in reason_types}
-        if category_reasons:
+    for category in _CATEGORY_ORDER:
+        if category in grouped:
             st.markdown(f"#### {category}")
-            for reason_type, explanations in category_reasons.items():
+            for reason_type, explanations in grouped[category]:
                 if reason_type == 'COMMON_PATTERN':
                     st.markdown("This MPIN is commonly used because:")
                     for explanation in explanations:
@@ -35,6 +50,69 @@ def display_reasons(reasons):
                     for explanation in explanations:
                         st.markdown(f"- {explanation}")
 
+@st.fragment
+def render_results():
+    # The button lives inside the fragment so clicking it reruns only this
+    # block; the inputs are read from session state rather than arguments.
+    validate_button = st.button("Validate MPIN", type="primary", use_container_width=True)
+
+    st.markdown("### Validation Results")
+    
+    if validate_button:
+        mpin = st.session_state.get("mpin")
+        mpin_type = st.session_state.get("mpin_type")
+        dob = st.session_state.get("dob")
+        marital_status = st.session_state.get("marital_status")
+        if marital_status == "Married":
+            spouse_dob = st.session_state.get("spouse_dob")
+            anniversary = st.session_state.get("anniversary")
+        else:
+            spouse_dob = None
+            anniversary = None
+
+        if not mpin:
+            st.error("Please enter your MPIN!")
+        elif not mpin.isdigit():
+            st.error("MPIN must contain only numbers!")
+        elif len(mpin) != (6 if mpin_type == "6-digit MPIN" else 4):
+            st.error(f"MPIN must be {6 if mpin_type == '6-digit MPIN' else 4} digits long!")
+        elif not dob:
+            st.error("Please enter your date of birth!")
+        elif marital_status == "Married" and (not spouse_dob or not anniversary):
+            st.error("Please enter both spouse's date of birth and wedding anniversary!")
+        else:
+            dob_str = format_date(dob)
+            spouse_dob_str = format_date(spouse_dob) if spouse_dob else None
+            anniversary_str = format_date(anniversary) if anniversary else None
+
+            strength, reasons, strength_percentage, color = validate_cached(
+                mpin, dob_str, spouse_dob_str, anniversary_str
+            )
+
+            result_col1, result_col2 = st.columns(2)
+            
+            with result_col1:
+                st.metric(
+                    "Strength",
+                    strength,
+                    f"{strength_percentage}%"
+                )
+
+            with result_col2:
+                if color == "red":
+                    st.error("MPIN is Weak")
+                else:
+                    st.success("MPIN is Strong")
+
+            st.progress(strength_percentage / 100)
+
+            if reasons:
+                display_reasons(reasons)
+            else:
+                st.success("No patterns detected! This is a strong MPIN.")
+    else:
+        st.info("Enter your details and click 'Validate MPIN' to see the results.")
+
 def main():
     st.set_page_config(
         page_title="MPIN Strength Validator",
@@ -44,8 +122,6 @@ def main():
 
     st.title(" MPIN Strength Validator")
     
-    validator = MPINValidator()
-
     input_col, output_col = st.columns([1, 1])
 
     with input_col:
@@ -53,136 +129,58 @@ def main():
         mpin_type = st.radio(
             "Select MPIN Type",
             ["4-digit MPIN", "6-digit MPIN"],
-            horizontal=True
+            horizontal=True,
+            key="mpin_type"
         )
 
-        mpin = st.text_input(
+        st.text_input(
             "Enter your MPIN",
             max_chars=6 if mpin_type == "6-digit MPIN" else 4,
             help="Enter your MPIN (numbers only)",
-            placeholder="Enter 4 or 6 digit MPIN"
+            placeholder="Enter 4 or 6 digit MPIN",
+            key="mpin"
         )
 
-        dob = st.date_input(
+        st.date_input(
             "Your Date of Birth",
             value=None,
             help="Select your date of birth",
             format="DD-MM-YYYY",
             min_value=datetime(1900, 1, 1),
-            max_value=datetime.now()
+            max_value=datetime.now(),
+            key="dob"
         )
         
         marital_status = st.radio(
             "Marital Status",
             ["Single", "Married"],
-            horizontal=True
+            horizontal=True,
+            key="marital_status"
         )
         
         if marital_status == "Married":
-            spouse_dob = st.date_input(
+            st.date_input(
                 "Spouse's Date of Birth",
                 value=None,
                 help="Select your spouse's date of birth",
                 format="DD-MM-YYYY",
                 min_value=datetime(1900, 1, 1),
-                max_value=datetime.now()
+                max_value=datetime.now(),
+                key="spouse_dob"
             )
             
-            anniversary = st.date_input(
+            st.date_input(
                 "Wedding Anniversary",
                 value=None,
                 help="Select your wedding anniversary date",
                 format="DD-MM-YYYY",
                 min_value=datetime(1900, 1, 1),
-                max_value=datetime.now()
+                max_value=datetime.now(),
+                key="anniversary"
             )
-        else:
-            spouse_dob = None
-            anniversary = None
-
-        validate_button = st.button("Validate MPIN", type="primary", use_container_width=True)
 
     with output_col:
-        st.markdown("### Validation Results")
-        
-        if validate_button:
-            if not mpin:
-                st.error("Please enter your MPIN!")
-            elif not mpin.isdigit():
-                st.error("MPIN must contain only numbers!")
-            elif len(mpin) != (6 if mpin_type == "6-digit MPIN" else 4):
-                st.error(f"MPIN must be {6 if mpin_type == '6-digit MPIN' else 4} digits long!")
-            elif not dob:
-                st.error("Please enter your date of birth!")
-            elif marital_status == "Married" and (not spouse_dob or not anniversary):
-                st.error("Please enter both spouse's date of birth and wedding anniversary!")
-            else:
-                dob_str = format_date(dob)
-                spouse_dob_str = format_date(spouse_dob) if spouse_dob else None
-                anniversary_str = format_date(anniversary) if anniversary else None
-
-                strength, reasons, strength_percentage, color = validator.validate_mpin(
-                    mpin, dob_str, spouse_dob_str, anniversary_str
-                )
+        render_results()
 
-                result_col1, result_col2 = st.columns(2)
-                
-                with result_col1:
-                    st.metric(
-                        "Strength",
-                        strength,
-                        f"{strength_percentage}%"
-                    )
-
-                with result_col2:
-                    if color == "red":
-                        st.error("MPIN is Weak")
-                    else:
-                        st.success("MPIN is Strong")
-
-                if color == "red":
-                    st.markdown(
-                        f'<div style="background-color: #ffcdd2; padding: 10px; border-radius: 5px;">'
-                        f'<div style="width: {strength_percentage}%; background-color: #f44336; height: 20px; border-radius: 5px;"></div>'
-                        f'</div>',
-                        unsafe_allow_html=True
-                    )
-                else:
-                    st.markdown(
-                        f'<div style="background-color: #c8e6c9; padding: 10px; border-radius: 5px;">'
-                        f'<div style="width: {strength_percentage}%; background-color: #4caf50; height: 20px; border-radius: 5px;"></div>'
-                        f'</div>',
-                        unsafe_allow_html=True
-                    )
-
-                if reasons:
-                    st.markdown("#### Reasons for Weakness:")
-                    
-                    categories = {
-                        'Common Patterns': ['COMMON_PATTERN'],
-                        'Demographic Matches': ['DEMOGRAPHIC_DOB_SELF', 'DEMOGRAPHIC_DOB_SPOUSE',
-                                              'DEMOGRAPHIC_ANNIVERSARY', 'DEMOGRAPHIC_COMBINED'],
-                        'Format Issues': ['INVALID_FORMAT']
-                    }
-                    
-                    for category, reason_types in categories.items():
-                        category_reasons = {k: v for k, v in reasons.items() if k in reason_types}
-                        if category_reasons:
-                            st.markdown(f"**{category}**")
-                            for reason_type, explanations in category_reasons.items():
-                                if reason_type == 'COMMON_PATTERN':
-                                    for explanation in explanations:
-                                        st.markdown(f"• {explanation}")
-                                elif reason_type == 'DEMOGRAPHIC_COMBINED':
-                                    for explanation in explanations:
-                                        st.markdown(f"• {explanation}")
-                                else:
-                                    for explanation in explanations:
-                                        st.markdown(f"• {explanation}")
-                else:
-                    st.success("No patterns detected! This is a strong MPIN.")
-        else:
-            st.info("Enter your details and click 'Validate MPIN' to see the results.")
-            
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,8 +1,85 @@
 import re
-from datetime import datetime
+from functools import lru_cache
 from typing import List, Tuple, Union, Dict
 
+_MPIN_RE = re.compile(r'\d{4}|\d{6}').fullmatch
+
+@lru_cache(maxsize=4096)
+def _dmy(date_str: str) -> Tuple[str, str, str]:
+    """Split a DD-MM-YYYY date string into its day, month and two-digit year."""
+    d, m, y4 = date_str.split('-')
+    return d, m, y4[2:]
+
+@lru_cache(maxsize=8192)
+def _subsequence_re(pattern: str) -> re.Pattern:
+    """Compile a regex matching pattern's characters in order, gaps allowed."""
+    return re.compile('.*?'.join(map(re.escape, pattern)))
+
+def _digit_histogram(digits) -> List[int]:
+    """Count how often each digit 0-9 occurs in a digit string or sequence of ints."""
+    hist = [0] * 10
+    for d in digits:
+        hist[int(d)] += 1
+    return hist
+
+@lru_cache(maxsize=4096)
+def _digit_steps(digits: Tuple[int, ...]) -> Tuple[int, int, int]:
+    """Pack the steps between adjacent digits into 8-bit lanes of one int.
+
+    Returns (rising, falling, ones): lane i of rising holds
+    digits[i+1] - digits[i] + 16 and lane i of falling holds
+    digits[i] - digits[i+1] + 16, so a lane has bit 4 set exactly when that
+    step is non-decreasing (rising) or non-increasing (falling). The bias
+    keeps every lane positive so no borrow crosses into its neighbour.
+    ones has 0x01 in every step lane.
+    """
+    packed = 0
+    for i, d in enumerate(digits):
+        packed |= d << (8 * i)
+    ones = ((1 << (8 * max(len(digits) - 1, 0))) - 1) // 0xFF
+    low = packed & (ones * 0xFF)
+    high = packed >> 8
+    return high + ones * 0x10 - low, low + ones * 0x10 - high, ones
+
+# Every straight line on the keypad with its ready-made explanations:
+# (reason type, line, explanation, repeated-line explanation).
+_KEYPAD_LINES = tuple(
+    (reason_type, line,
+     f"{direction.capitalize()} keypad pattern ({line})",
+     f"Repeated {direction} keypad pattern ({line})")
+    for reason_type, direction, lines in [
+        ('KEYPAD_HORIZONTAL', 'horizontal', ['123', '456', '789']),
+        ('KEYPAD_VERTICAL', 'vertical', ['147', '258', '369']),
+        ('KEYPAD_DIAGONAL', 'diagonal', ['159', '357']),
+    ]
+    for line in lines
+)
+# Map every line and its reverse back to the line it was written as, then
+# match them all in one pass (the lookahead keeps overlapping hits).
+_KEYPAD_LINE_OF = {variant: line for _, line, _, _ in _KEYPAD_LINES for variant in (line, line[::-1])}
+_KEYPAD_RE = re.compile('(?=(' + '|'.join(_KEYPAD_LINE_OF) + '))')
+_KEYPAD_REPEAT_RE = re.compile('(?=(' + '|'.join(p * 2 for p in _KEYPAD_LINE_OF) + '))')
+_CORNER_DIGITS = (1, 3, 7, 9)
+
 class MPINValidator:
+    DEDUCTIONS = {
+        'REPETITIVE': 35,      
+        'ASCENDING': 35,       
+        'DESCENDING': 35,      
+        'ARITHMETIC': 40,      
+        'GEOMETRIC': 10,       
+        'KEYPAD_HORIZONTAL': 35,  
+        'KEYPAD_VERTICAL': 35,    
+        'KEYPAD_DIAGONAL': 35,    
+        'KEYPAD_CORNER': 35,      
+        'REPEATED_PAIR': 35,      
+        'REPEATED_SEQUENCE': 35,  
+        'DEMOGRAPHIC_DOB_SELF': 40,    
+        'DEMOGRAPHIC_DOB_SPOUSE': 40,  
+        'DEMOGRAPHIC_ANNIVERSARY': 40, 
+        'DEMOGRAPHIC_COMBINED': 20,    
+    }
+
     def __init__(self):
         self.keypad = [
             ['1', '2', '3'],
@@ -15,59 +92,42 @@ class MPINValidator:
             for j in range(len(self.keypad[i])):
                 self.keypad_positions[self.keypad[i][j]] = (i, j)
 
-    def get_keypad_neighbors(self, digit: str) -> List[str]:
-        """Get all possible neighboring digits on the keypad."""
-        if digit not in self.keypad_positions:
-            return []
-        
-        i, j = self.keypad_positions[digit]
-        neighbors = []
-        
         directions = [
-            (-1, -1), (-1, 0), (-1, 1),  
-            (0, -1),           (0, 1),    
-            (1, -1),  (1, 0),  (1, 1)     
+            (-1, -1), (-1, 0), (-1, 1),
+            (0, -1),           (0, 1),
+            (1, -1),  (1, 0),  (1, 1)
         ]
-        
-        for di, dj in directions:
-            ni, nj = i + di, j + dj
-            if 0 <= ni < len(self.keypad) and 0 <= nj < len(self.keypad[0]):
-                neighbor = self.keypad[ni][nj]
-                if neighbor.isdigit():  
-                    neighbors.append(neighbor)
-        
-        return neighbors
+        self.neighbors = {}
+        for key, (i, j) in self.keypad_positions.items():
+            neighbors = []
+            for di, dj in directions:
+                ni, nj = i + di, j + dj
+                if 0 <= ni < len(self.keypad) and 0 <= nj < len(self.keypad[0]):
+                    neighbor = self.keypad[ni][nj]
+                    if neighbor.isdigit():
+                        neighbors.append(neighbor)
+            self.neighbors[key] = tuple(neighbors)
 
-    def is_keypad_pattern(self, mpin: str) -> Tuple[bool, List[Tuple[str, str]]]:
-        """Check if MPIN follows keypad patterns."""
+    def get_keypad_neighbors(self, digit: str) -> List[str]:
+        """Get all possible neighboring digits on the keypad."""
+        return list(self.neighbors.get(digit, ()))
+
+    def is_keypad_pattern(self, mpin: str, hist: List[int] = None) -> Tuple[bool, List[Tuple[str, str]]]:
+        """Check if MPIN follows keypad patterns; hist counts each digit 0-9 in mpin."""
+        if hist is None:
+            hist = _digit_histogram(mpin)
         reasons = []
         
-        horizontal_patterns = ['123', '456', '789']
-        vertical_patterns = ['147', '258', '369']
-        diagonal_patterns = ['159', '357']
-        corner_digits = {'1', '3', '7', '9'}  
-        
-        for pattern in horizontal_patterns:
-            if pattern in mpin or pattern[::-1] in mpin:
-                reasons.append(("KEYPAD_HORIZONTAL", f"Horizontal keypad pattern ({pattern})"))
-            if pattern * 2 in mpin or (pattern[::-1] * 2) in mpin:
-                reasons.append(("KEYPAD_HORIZONTAL", f"Repeated horizontal keypad pattern ({pattern})"))
+        found = {_KEYPAD_LINE_OF[m.group(1)] for m in _KEYPAD_RE.finditer(mpin)}
+        repeated = {_KEYPAD_LINE_OF[m.group(1)[:3]] for m in _KEYPAD_REPEAT_RE.finditer(mpin)}
+        for reason_type, line, explanation, repeated_explanation in _KEYPAD_LINES:
+            if line in found:
+                reasons.append((reason_type, explanation))
+            if line in repeated:
+                reasons.append((reason_type, repeated_explanation))
         
-        for pattern in vertical_patterns:
-            if pattern in mpin or pattern[::-1] in mpin:
-                reasons.append(("KEYPAD_VERTICAL", f"Vertical keypad pattern ({pattern})"))
-            if pattern * 2 in mpin or (pattern[::-1] * 2) in mpin:
-                reasons.append(("KEYPAD_VERTICAL", f"Repeated vertical keypad pattern ({pattern})"))
-        
-        for pattern in diagonal_patterns:
-            if pattern in mpin or pattern[::-1] in mpin:
-                reasons.append(("KEYPAD_DIAGONAL", f"Diagonal keypad pattern ({pattern})"))
-            if pattern * 2 in mpin or (pattern[::-1] * 2) in mpin:
-                reasons.append(("KEYPAD_DIAGONAL", f"Repeated diagonal keypad pattern ({pattern})"))
-        
-        mpin_digits = set(mpin)
-        if mpin_digits.issubset(corner_digits):
-            used_corners = sorted(list(mpin_digits))
+        if sum(hist[c] for c in _CORNER_DIGITS) == len(mpin):
+            used_corners = [str(c) for c in _CORNER_DIGITS if hist[c]]
             if len(used_corners) == 4:
                 reasons.append(("KEYPAD_CORNER", "Common keypad pattern using all four corners"))
             elif len(used_corners) == 3:
@@ -77,50 +137,51 @@ class MPINValidator:
         
         return bool(reasons), reasons
 
-    def is_arithmetic_progression(self, mpin: str) -> Tuple[bool, str]:
+    def is_arithmetic_progression(self, digits: Tuple[int, ...]) -> Tuple[bool, str]:
         """Check if MPIN forms an arithmetic progression."""
-        digits = [int(d) for d in mpin]
         if len(digits) < 2:
             return False, ""
-        diff = digits[1] - digits[0]
-        is_progression = all(digits[i] - digits[i-1] == diff for i in range(1, len(digits)))
-        if is_progression:
+        rising, _, ones = _digit_steps(digits)
+        diff = (rising & 0xFF) - 0x10
+        if rising == (rising & 0xFF) * ones:
             return True, f"Arithmetic progression with difference {diff}"
         return False, ""
 
-    def is_geometric_progression(self, mpin: str) -> Tuple[bool, str]:
+    def is_geometric_progression(self, digits: Tuple[int, ...]) -> Tuple[bool, str]:
         """Check if MPIN forms a geometric progression."""
-        digits = [int(d) for d in mpin]
         if len(digits) < 2 or 0 in digits:
             return False, ""
         ratio = digits[1] / digits[0]
-        is_progression = all(digits[i] / digits[i-1] == ratio for i in range(1, len(digits)))
+        is_progression = all(b / a == ratio for a, b in zip(digits, digits[1:]))
         if is_progression:
             return True, f"Geometric progression with ratio {ratio}"
         return False, ""
 
-    def is_repetitive(self, mpin: str) -> Tuple[bool, str]:
-        """Check if MPIN has repetitive patterns."""
-        if len(set(mpin)) == 1:
-            return True, f"All digits are same ({mpin[0]})"
+    def is_repetitive(self, mpin: str, hist: List[int] = None) -> Tuple[bool, str]:
+        """Check if MPIN has repetitive patterns; hist counts each digit 0-9 in mpin."""
+        if hist is None:
+            hist = _digit_histogram(mpin)
+        length = len(mpin)
+        if length and length in hist:
+            return True, f"All digits are same ({hist.index(length)})"
         return False, ""
 
-    def is_ascending(self, mpin: str) -> Tuple[bool, str]:
+    def is_ascending(self, digits: Tuple[int, ...]) -> Tuple[bool, str]:
         """Check if MPIN is in ascending order."""
-        is_asc = all(int(mpin[i]) <= int(mpin[i+1]) for i in range(len(mpin)-1))
-        if is_asc:
+        rising, _, ones = _digit_steps(digits)
+        if rising & (ones * 0x10) == ones * 0x10:
             return True, "Digits are in ascending order"
         return False, ""
 
-    def is_descending(self, mpin: str) -> Tuple[bool, str]:
+    def is_descending(self, digits: Tuple[int, ...]) -> Tuple[bool, str]:
         """Check if MPIN is in descending order."""
-        is_desc = all(int(mpin[i]) >= int(mpin[i+1]) for i in range(len(mpin)-1))
-        if is_desc:
+        _, falling, ones = _digit_steps(digits)
+        if falling & (ones * 0x10) == ones * 0x10:
             return True, "Digits are in descending order"
         return False, ""
 
-    def is_common_pattern(self, mpin: str) -> Tuple[bool, List[Tuple[str, str]]]:
-        """Check if MPIN follows common patterns."""
+    def is_common_pattern(self, mpin: str, hist: List[int] = None) -> Tuple[bool, List[Tuple[str, str]]]:
+        """Check if MPIN follows common patterns; hist counts each digit 0-9 in mpin."""
         reasons = []
         
         if len(mpin) >= 4:
@@ -133,146 +194,121 @@ class MPINValidator:
                 if mpin[:i] * (len(mpin)//i) == mpin:
                     reasons.append(("REPEATED_SEQUENCE", f"Repeated sequence ({mpin[:i]})"))
 
-        is_keypad, keypad_reasons = self.is_keypad_pattern(mpin)
+        is_keypad, keypad_reasons = self.is_keypad_pattern(mpin, hist)
         if is_keypad:
             reasons.extend(keypad_reasons)
 
         return bool(reasons), reasons
 
-    def extract_date_patterns(self, date_str: str) -> List[str]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def extract_date_patterns(date_str: str) -> Tuple[str, ...]:
         """Extract possible date patterns from a date string."""
         try:
-            date = datetime.strptime(date_str, '%d-%m-%Y')
-            patterns = []
-            
-            patterns.extend([
-                date.strftime('%d%m'),  
-                date.strftime('%m%d'),  
-                date.strftime('%y%m'),  
-                date.strftime('%m%y'),  
-                date.strftime('%y%d'),  
-                date.strftime('%d%y'),  
-            ])
-            
-            patterns.extend([
-                date.strftime('%d%m%y'),  
-                date.strftime('%y%m%d'),  
-                date.strftime('%m%d%y'),  
-                date.strftime('%y%d%m'), 
-            ])
-            
-            return patterns
+            d, m, y2 = _dmy(date_str)
+            return (
+                d + m, m + d, y2 + m, m + y2, y2 + d, d + y2,
+                d + m + y2, y2 + m + d, m + d + y2, y2 + d + m,
+            )
         except ValueError:
-            return []
+            return ()
 
-    def extract_year_patterns(self, date_str: str) -> List[str]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def extract_year_patterns(date_str: str) -> Tuple[str, ...]:
         """Extract year patterns from a date string."""
         try:
-            date = datetime.strptime(date_str, '%d-%m-%Y')
-            patterns = []
-            
-            patterns.append(date.strftime('%Y'))
-            
-            patterns.append(date.strftime('%y'))
-            
-            return patterns
+            _, _, y4 = date_str.split('-')
+            return y4, y4[2:]
         except ValueError:
-            return []
+            return ()
 
     def is_subsequence(self, pattern: str, mpin: str) -> bool:
         """Check if pattern is a subsequence of mpin."""
-        if len(pattern) <= 1:
-            return False
-            
-        pattern_idx = 0
-        for digit in mpin:
-            if pattern_idx < len(pattern) and digit == pattern[pattern_idx]:
-                pattern_idx += 1
-        return pattern_idx == len(pattern)
-
-    def extract_combined_date_patterns(self, dob1: str, dob2: str = None) -> List[str]:
-        """Extract combined patterns from two dates."""
+        return len(pattern) > 1 and _subsequence_re(pattern).search(mpin) is not None
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def extract_combined_date_patterns(dob1: str, dob2: str = None, dob1_type: str = 'first',
+                                       dob2_type: str = 'second') -> Tuple[Tuple[str, str], ...]:
+        """Extract combined patterns from two dates, each paired with a label describing it."""
         try:
-            date1 = datetime.strptime(dob1, '%d-%m-%Y')
+            d1, m1, y1 = _dmy(dob1)
             patterns = []
             
             if dob2:
-                date2 = datetime.strptime(dob2, '%d-%m-%Y')
-                
-                d1 = date1.strftime('%d')  
-                m1 = date1.strftime('%m')  
-                y1 = date1.strftime('%y')  
-                                
-                d2 = date2.strftime('%d')  
-                m2 = date2.strftime('%m')  
-                y2 = date2.strftime('%y')  
-                
-                patterns.append(f"{d1}{d2}")  
-                patterns.append(f"{d2}{d1}")  
-                
-                patterns.append(f"{m1}{m2}")  
-                patterns.append(f"{m2}{m1}")  
-                
-                patterns.append(f"{d1}{m2}")  
-                patterns.append(f"{m2}{d1}")  
-                
-                patterns.append(f"{m1}{d2}")  
-                patterns.append(f"{d2}{m1}")  
-                
-                patterns.append(f"{y1}{y2}")  
-                patterns.append(f"{y2}{y1}")  
-                
-                patterns.append(f"{d1}{y2}")  
-                patterns.append(f"{y2}{d1}")  
-                
-                patterns.append(f"{m1}{y2}")  
-                patterns.append(f"{y2}{m1}")  
-                
-                patterns.append(f"{d2}{y1}")  
-                patterns.append(f"{y1}{d2}")  
-                
-                patterns.append(f"{m2}{y1}")  
-                patterns.append(f"{y1}{m2}")  
+                d2, m2, y2 = _dmy(dob2)
+
+                # Day/month pairings carry a label naming their parts; the rest
+                # are described generically.
+                pairings = [
+                    (f"{d1}{d2}", f"(day from {dob1_type} DOB {d1} + day from {dob2_type} DOB {d2})"),
+                    (f"{d2}{d1}", f"(day from {dob2_type} DOB {d2} + day from {dob1_type} DOB {d1})"),
+                    (f"{m1}{m2}", None), (f"{m2}{m1}", None),
+                    (f"{d1}{m2}", f"(day from {dob1_type} DOB {d1} + month from {dob2_type} DOB {m2})"),
+                    (f"{m2}{d1}", f"(month from {dob2_type} DOB {m2} + day from {dob1_type} DOB {d1})"),
+                    (f"{m1}{d2}", f"(month from {dob1_type} DOB {m1} + day from {dob2_type} DOB {d2})"),
+                    (f"{d2}{m1}", f"(day from {dob2_type} DOB {d2} + month from {dob1_type} DOB {m1})"),
+                    (f"{y1}{y2}", None), (f"{y2}{y1}", None),
+                    (f"{d1}{y2}", None), (f"{y2}{d1}", None),
+                    (f"{m1}{y2}", None), (f"{y2}{m1}", None),
+                    (f"{d2}{y1}", None), (f"{y1}{d2}", None),
+                    (f"{m2}{y1}", None), (f"{y1}{m2}", None),
+                ]
+                # When several labelled pairings spell the same digits, the
+                # first one listed names the match.
+                labels = {}
+                for pattern, label in pairings:
+                    if label:
+                        labels.setdefault(pattern, label)
+                generic = f"from {dob1_type} and {dob2_type} DOBs"
+                patterns = [(pattern, labels.get(pattern, generic)) for pattern, _ in pairings]
             
-            return patterns
+            return tuple(patterns)
         except ValueError:
-            return []
+            return ()
 
     def validate_mpin(self, mpin: str, dob: str = None, spouse_dob: str = None, 
                      anniversary: str = None) -> Tuple[str, Dict[str, List[str]], int, str]:
         
-        if not mpin.isdigit() or len(mpin) not in [4, 6]:
+        if not _MPIN_RE(mpin):
             return 'WEAK', {'INVALID_FORMAT': ['MPIN must be 4 or 6 digits']}, 0, 'red'
 
+        digits = tuple(map(int, mpin))
+        hist = _digit_histogram(digits)
         reasons = {}
         pattern_reasons = []
         
-        is_common, common_reasons = self.is_common_pattern(mpin)
+        is_common, common_reasons = self.is_common_pattern(mpin, hist)
         if is_common:
-            pattern_reasons.extend([reason[1] for reason in common_reasons])
+            pattern_reasons.extend(common_reasons)
 
-        is_arithmetic, arithmetic_reason = self.is_arithmetic_progression(mpin)
+        is_arithmetic, arithmetic_reason = self.is_arithmetic_progression(digits)
         if is_arithmetic:
-            pattern_reasons.append(arithmetic_reason)
+            pattern_reasons.append(('ARITHMETIC', arithmetic_reason))
 
-        is_geometric, geometric_reason = self.is_geometric_progression(mpin)
+        is_geometric, geometric_reason = self.is_geometric_progression(digits)
         if is_geometric:
-            pattern_reasons.append(geometric_reason)
+            pattern_reasons.append(('GEOMETRIC', geometric_reason))
 
-        is_rep, rep_reason = self.is_repetitive(mpin)
+        is_rep, rep_reason = self.is_repetitive(mpin, hist)
         if is_rep:
-            pattern_reasons.append(rep_reason)
+            pattern_reasons.append(('REPETITIVE', rep_reason))
 
-        is_asc, asc_reason = self.is_ascending(mpin)
+        is_asc, asc_reason = self.is_ascending(digits)
         if is_asc:
-            pattern_reasons.append(asc_reason)
+            pattern_reasons.append(('ASCENDING', asc_reason))
 
-        is_desc, desc_reason = self.is_descending(mpin)
+        is_desc, desc_reason = self.is_descending(digits)
         if is_desc:
-            pattern_reasons.append(desc_reason)
+            pattern_reasons.append(('DESCENDING', desc_reason))
 
         if pattern_reasons:
-            reasons['COMMON_PATTERN'] = pattern_reasons
+            reasons['COMMON_PATTERN'] = [explanation for _, explanation in pattern_reasons]
+
+        # Track the score as reasons are recorded so the remaining demographic
+        # checks can be skipped once the MPIN is already at 0%.
+        score = 100 - sum(self._deduction(tag, explanation) for tag, explanation in pattern_reasons)
 
         dates = []
         if dob:
@@ -284,93 +320,75 @@ class MPINValidator:
 
         for i in range(len(dates)):
             for j in range(i + 1, len(dates)):
+                if score <= 0:
+                    break
                 date1_type, date1 = dates[i]
                 date2_type, date2 = dates[j]
                 
-                combined_patterns = self.extract_combined_date_patterns(date1, date2)
-                for pattern in combined_patterns:
+                combined_patterns = self.extract_combined_date_patterns(date1, date2, date1_type, date2_type)
+                for pattern, label in combined_patterns:
                     if len(pattern) == len(mpin) and pattern == mpin:
-                        date1_obj = datetime.strptime(date1, '%d-%m-%Y')
-                        date2_obj = datetime.strptime(date2, '%d-%m-%Y')
-                        d1 = date1_obj.strftime('%d')
-                        m1 = date1_obj.strftime('%m')
-                        d2 = date2_obj.strftime('%d')
-                        m2 = date2_obj.strftime('%m')
-                        
-                        if pattern == f"{d1}{d2}":
-                            reasons['DEMOGRAPHIC_COMBINED'] = [f"DEMOGRAPHIC_COMBINED : Match with combined pattern (day from {date1_type} DOB {d1} + day from {date2_type} DOB {d2})"]
-                        elif pattern == f"{d2}{d1}":
-                            reasons['DEMOGRAPHIC_COMBINED'] = [f"DEMOGRAPHIC_COMBINED : Match with combined pattern (day from {date2_type} DOB {d2} + day from {date1_type} DOB {d1})"]
-                        elif pattern == f"{d1}{m2}":
-                            reasons['DEMOGRAPHIC_COMBINED'] = [f"DEMOGRAPHIC_COMBINED : Match with combined pattern (day from {date1_type} DOB {d1} + month from {date2_type} DOB {m2})"]
-                        elif pattern == f"{m2}{d1}":
-                            reasons['DEMOGRAPHIC_COMBINED'] = [f"DEMOGRAPHIC_COMBINED : Match with combined pattern (month from {date2_type} DOB {m2} + day from {date1_type} DOB {d1})"]
-                        elif pattern == f"{m1}{d2}":
-                            reasons['DEMOGRAPHIC_COMBINED'] = [f"DEMOGRAPHIC_COMBINED : Match with combined pattern (month from {date1_type} DOB {m1} + day from {date2_type} DOB {d2})"]
-                        elif pattern == f"{d2}{m1}":
-                            reasons['DEMOGRAPHIC_COMBINED'] = [f"DEMOGRAPHIC_COMBINED : Match with combined pattern (day from {date2_type} DOB {d2} + month from {date1_type} DOB {m1})"]
-                        else:
-                            reasons['DEMOGRAPHIC_COMBINED'] = [f"DEMOGRAPHIC_COMBINED : Match with combined pattern from {date1_type} and {date2_type} DOBs"]
+                        score -= self._set_reason(reasons, 'DEMOGRAPHIC_COMBINED', f"DEMOGRAPHIC_COMBINED : Match with combined pattern {label}")
                         break
                     elif self.is_subsequence(pattern, mpin):
-                        reasons['DEMOGRAPHIC_COMBINED'] = [f"DEMOGRAPHIC_COMBINED : Contains subsequence from combined {date1_type} and {date2_type} DOB pattern"]
+                        score -= self._set_reason(reasons, 'DEMOGRAPHIC_COMBINED', f"DEMOGRAPHIC_COMBINED : Contains subsequence from combined {date1_type} and {date2_type} DOB pattern")
                         break
 
-        if dob:
+        if dob and score > 0:
             year_patterns = self.extract_year_patterns(dob)
             for pattern in year_patterns:
                 if len(pattern) == len(mpin) and pattern == mpin:
-                    reasons['DEMOGRAPHIC_DOB_SELF'] = [f"DEMOGRAPHIC_DOB_SELF : Match with your birth year ({dob})"]
+                    score -= self._set_reason(reasons, 'DEMOGRAPHIC_DOB_SELF', f"DEMOGRAPHIC_DOB_SELF : Match with your birth year ({dob})")
                     break
                 elif self.is_subsequence(pattern, mpin):
-                    reasons['DEMOGRAPHIC_DOB_SELF'] = [f"DEMOGRAPHIC_DOB_SELF : Contains subsequence from your birth year ({dob})"]
+                    score -= self._set_reason(reasons, 'DEMOGRAPHIC_DOB_SELF', f"DEMOGRAPHIC_DOB_SELF : Contains subsequence from your birth year ({dob})")
                     break
             
             dob_patterns = self.extract_date_patterns(dob)
             for pattern in dob_patterns:
                 if len(pattern) == len(mpin) and pattern == mpin:
-                    reasons['DEMOGRAPHIC_DOB_SELF'] = [f"DEMOGRAPHIC_DOB_SELF : Match with your date of birth ({dob})"]
+                    score -= self._set_reason(reasons, 'DEMOGRAPHIC_DOB_SELF', f"DEMOGRAPHIC_DOB_SELF : Match with your date of birth ({dob})")
                     break
                 elif self.is_subsequence(pattern, mpin):
-                    reasons['DEMOGRAPHIC_DOB_SELF'] = [f"DEMOGRAPHIC_DOB_SELF : Contains subsequence from your date of birth ({dob})"]
+                    score -= self._set_reason(reasons, 'DEMOGRAPHIC_DOB_SELF', f"DEMOGRAPHIC_DOB_SELF : Contains subsequence from your date of birth ({dob})")
                     break
         
-        if spouse_dob:
+        if spouse_dob and score > 0:
             year_patterns = self.extract_year_patterns(spouse_dob)
             for pattern in year_patterns:
                 if len(pattern) == len(mpin) and pattern == mpin:
-                    reasons['DEMOGRAPHIC_DOB_SPOUSE'] = [f"DEMOGRAPHIC_DOB_SPOUSE : Match with spouse's birth year ({spouse_dob})"]
+                    score -= self._set_reason(reasons, 'DEMOGRAPHIC_DOB_SPOUSE', f"DEMOGRAPHIC_DOB_SPOUSE : Match with spouse's birth year ({spouse_dob})")
                     break
                 elif self.is_subsequence(pattern, mpin):
-                    reasons['DEMOGRAPHIC_DOB_SPOUSE'] = [f"DEMOGRAPHIC_DOB_SPOUSE : Contains subsequence from spouse's birth year ({spouse_dob})"]
+                    score -= self._set_reason(reasons, 'DEMOGRAPHIC_DOB_SPOUSE', f"DEMOGRAPHIC_DOB_SPOUSE : Contains subsequence from spouse's birth year ({spouse_dob})")
                     break
             
             spouse_dob_patterns = self.extract_date_patterns(spouse_dob)
             for pattern in spouse_dob_patterns:
                 if len(pattern) == len(mpin) and pattern == mpin:
-                    reasons['DEMOGRAPHIC_DOB_SPOUSE'] = [f"DEMOGRAPHIC_DOB_SPOUSE : Match with spouse's date of birth ({spouse_dob})"]
+                    score -= self._set_reason(reasons, 'DEMOGRAPHIC_DOB_SPOUSE', f"DEMOGRAPHIC_DOB_SPOUSE : Match with spouse's date of birth ({spouse_dob})")
                     break
                 elif self.is_subsequence(pattern, mpin):
-                    reasons['DEMOGRAPHIC_DOB_SPOUSE'] = [f"DEMOGRAPHIC_DOB_SPOUSE : Contains subsequence from spouse's date of birth ({spouse_dob})"]
+                    score -= self._set_reason(reasons, 'DEMOGRAPHIC_DOB_SPOUSE', f"DEMOGRAPHIC_DOB_SPOUSE : Contains subsequence from spouse's date of birth ({spouse_dob})")
                     break
         
-        if anniversary:
+        if anniversary and score > 0:
             year_patterns = self.extract_year_patterns(anniversary)
             for pattern in year_patterns:
                 if len(pattern) == len(mpin) and pattern == mpin:
-                    reasons['DEMOGRAPHIC_ANNIVERSARY'] = [f"DEMOGRAPHIC_ANNIVERSARY : Match with wedding anniversary year ({anniversary})"]
+                    score -= self._set_reason(reasons, 'DEMOGRAPHIC_ANNIVERSARY', f"DEMOGRAPHIC_ANNIVERSARY : Match with wedding anniversary year ({anniversary})")
                     break
             
             anniversary_patterns = self.extract_date_patterns(anniversary)
             for pattern in anniversary_patterns:
                 if len(pattern) == len(mpin) and pattern == mpin:
-                    reasons['DEMOGRAPHIC_ANNIVERSARY'] = [f"DEMOGRAPHIC_ANNIVERSARY : Match with wedding anniversary date ({anniversary})"]
+                    score -= self._set_reason(reasons, 'DEMOGRAPHIC_ANNIVERSARY', f"DEMOGRAPHIC_ANNIVERSARY : Match with wedding anniversary date ({anniversary})")
                     break
                 elif self.is_subsequence(pattern, mpin):
-                    reasons['DEMOGRAPHIC_ANNIVERSARY'] = [f"DEMOGRAPHIC_ANNIVERSARY : Contains subsequence from wedding anniversary date ({anniversary})"]
+                    score -= self._set_reason(reasons, 'DEMOGRAPHIC_ANNIVERSARY', f"DEMOGRAPHIC_ANNIVERSARY : Contains subsequence from wedding anniversary date ({anniversary})")
                     break
 
-        strength_percentage = self.calculate_strength_percentage(reasons)
+        strength_percentage = max(0, score)
         
         if strength_percentage >= 70:
             strength = 'STRONG'
@@ -381,73 +399,56 @@ class MPINValidator:
         
         return strength, reasons, strength_percentage, color
 
-    def calculate_strength_percentage(self, reasons: Dict[str, List[str]]) -> int:
-        """Calculate strength percentage based on reasons."""
+    def _deduction(self, reason: str, explanation: str) -> int:
+        """Points deducted for a single explanation recorded under reason.
+
+        reason is a demographic reason key or, for common patterns, the
+        pattern's own reason type (e.g. ARITHMETIC, KEYPAD_CORNER).
+        """
+        deductions = self.DEDUCTIONS
+        if reason.startswith('DEMOGRAPHIC_'):
+            if 'Match with' in explanation:
+                if 'birth year' in explanation or 'anniversary year' in explanation:
+                    return 20
+                elif reason == 'DEMOGRAPHIC_COMBINED':
+                    return deductions['DEMOGRAPHIC_COMBINED']
+                else:
+                    return deductions[reason]
+            elif 'Contains subsequence' in explanation:
+                if 'birth year' in explanation or 'anniversary year' in explanation:
+                    return 5
+                elif reason == 'DEMOGRAPHIC_COMBINED':
+                    return 5
+                else:
+                    return 10
+            return 0
+        return deductions.get(reason, 0)
+
+    def _set_reason(self, reasons: Dict[str, List[str]], reason: str, explanation: str) -> int:
+        """Record explanation as the only one for reason and return the net extra deduction."""
+        previous = reasons.get(reason)
+        reasons[reason] = [explanation]
+        return self._deduction(reason, explanation) - (self._deduction(reason, previous[0]) if previous else 0)
+
+    def calculate_strength_percentage(self, reasons: Dict[str, List[str]],
+                                      pattern_reasons: List[Tuple[str, str]]) -> int:
+        """Calculate strength percentage based on reasons.
+
+        COMMON_PATTERN is scored from pattern_reasons, the (reason type,
+        explanation) pairs its explanations were taken from. validate_mpin
+        does not call this method and does not return those pairs, so the
+        reasons it returns cannot be re-scored here on their own; given the
+        same pairs, the result matches validate_mpin's percentage.
+        """
+        if len(pattern_reasons) != len(reasons.get('COMMON_PATTERN', [])):
+            raise ValueError("pattern_reasons must hold one (reason type, explanation) pair "
+                             "per COMMON_PATTERN explanation")
         if not reasons:
             return 100
         
-        base_strength = 100
-        deductions = {
-            'REPETITIVE': 35,      
-            'ASCENDING': 35,       
-            'DESCENDING': 35,      
-            'ARITHMETIC': 40,      
-            'GEOMETRIC': 10,       
-            'KEYPAD_HORIZONTAL': 35,  
-            'KEYPAD_VERTICAL': 35,    
-            'KEYPAD_DIAGONAL': 35,    
-            'KEYPAD_CORNER': 35,      
-            'REPEATED_PAIR': 35,      
-            'REPEATED_SEQUENCE': 35,  
-            'DEMOGRAPHIC_DOB_SELF': 40,    
-            'DEMOGRAPHIC_DOB_SPOUSE': 40,  
-            'DEMOGRAPHIC_ANNIVERSARY': 40, 
-            'DEMOGRAPHIC_COMBINED': 20,    
-        }
-        
-        total_deduction = 0
+        total_deduction = sum(self._deduction(tag, explanation) for tag, explanation in pattern_reasons)
         for reason, explanations in reasons.items():
-            if reason == 'COMMON_PATTERN':
-                for explanation in explanations:
-                    if 'Arithmetic progression' in explanation:
-                        total_deduction += deductions['ARITHMETIC']
-                    elif 'Geometric progression' in explanation:
-                        total_deduction += deductions['GEOMETRIC']
-                    elif 'All digits are same' in explanation:
-                        total_deduction += deductions['REPETITIVE']
-                    elif 'Digits are in ascending order' in explanation:
-                        total_deduction += deductions['ASCENDING']
-                    elif 'Digits are in descending order' in explanation:
-                        total_deduction += deductions['DESCENDING']
-                    elif 'Repeated pair pattern' in explanation:
-                        total_deduction += deductions['REPEATED_PAIR']
-                    elif 'Repeated sequence' in explanation:
-                        total_deduction += deductions['REPEATED_SEQUENCE']
-                    elif 'Horizontal keypad pattern' in explanation:
-                        total_deduction += deductions['KEYPAD_HORIZONTAL']
-                    elif 'Vertical keypad pattern' in explanation:
-                        total_deduction += deductions['KEYPAD_VERTICAL']
-                    elif 'Diagonal keypad pattern' in explanation:
-                        total_deduction += deductions['KEYPAD_DIAGONAL']
-                    elif 'Common keypad pattern using' in explanation:
-                        total_deduction += deductions['KEYPAD_CORNER']
-            elif reason.startswith('DEMOGRAPHIC_'):
-                for explanation in explanations:
-                    if 'Match with' in explanation:
-                        if 'birth year' in explanation or 'anniversary year' in explanation:
-                            total_deduction += 20  
-                        elif reason == 'DEMOGRAPHIC_COMBINED':
-                            total_deduction += deductions['DEMOGRAPHIC_COMBINED']  
-                        else:
-                            total_deduction += deductions[reason]
-                    elif 'Contains subsequence' in explanation:
-                        if 'birth year' in explanation or 'anniversary year' in explanation:
-                            total_deduction += 5  
-                        elif reason == 'DEMOGRAPHIC_COMBINED':
-                            total_deduction += 5  
-                        else:
-                            total_deduction += 10 
-            else:
-                total_deduction += deductions.get(reason, 0)
+            if reason != 'COMMON_PATTERN':
+                total_deduction += sum(self._deduction(reason, explanation) for explanation in explanations)
         
-        return max(0, base_strength - total_deduction)
\ No newline at end of file
+        return max(0, 100 - total_deduction)